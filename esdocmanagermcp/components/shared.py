@@ -2,24 +2,77 @@ import logging
 import inspect
 
 import os
-from typing import Any, List, Optional, Dict
-from urllib.parse import urlparse
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, NamedTuple, Optional, Dict
+from urllib.parse import urlsplit
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, SecretStr, model_validator
 from elasticsearch import AsyncElasticsearch
 
-logger = logging.getLogger(__name__)
+_RETRY_ON_STATUS = (408, 429, 502, 503, 504)
+
+# Static AsyncElasticsearch arguments shared by every client we create
+_ES_CLIENT_BASE_ARGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "request_timeout": 180,
+        "http_compress": True,
+        "retry_on_status": _RETRY_ON_STATUS,
+        "retry_on_timeout": True,
+        "max_retries": 5,
+    }
+)
+
+# Static Elasticsearch output settings passed to the crawler
+_CRAWLER_ES_BASE_SETTINGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "request_timeout": 600,
+        "elasticsearch.bulk_api.max_items": 1000,
+        "elasticsearch.bulk_api.max_size_bytes": 10485760,
+    }
+)
+
+
+class _HostParts(NamedTuple):
+    """The components of a host URL needed to connect to Elasticsearch."""
+
+    scheme: str
+    hostname: Optional[str]
+    port: int
+
+
+@lru_cache(maxsize=128)
+def _split_host(host: str) -> _HostParts:
+    """Split a host URL into its scheme, hostname and port, caching the result per unique host string."""
+    parsed_url = urlsplit(host)
+    port = parsed_url.port
+    if port is None:
+        # Default to 443 for HTTPS
+        port = 443 if parsed_url.scheme == "https" else 80
+    return _HostParts(parsed_url.scheme, parsed_url.hostname, port)
+
+
+def _build_auth_args(
+    api_key: Optional[SecretStr], username: Optional[str], password: Optional[SecretStr]
+) -> Dict[str, Any]:
+    """Build the Elasticsearch authentication arguments shared by the client and the crawler."""
+    if api_key:
+        return {"api_key": api_key.get_secret_value()}
+    if username and password:
+        return {"basic_auth": (username, password.get_secret_value())}
+    return {}
+
 
 class LoggingSettings(BaseSettings):
     """Settings for configuring logging."""
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True)
 
     log_level: str = Field("INFO", validation_alias="LOG_LEVEL")
 
     # include the PID in the log format
     log_format: str = Field(
-        f"%(asctime)s : {os.getpid()} - %(name)s - %(levelname)s - %(message)s",
+        default_factory=lambda: f"%(asctime)s : {os.getpid()} - %(name)s - %(levelname)s - %(message)s",
         validation_alias="LOG_FORMAT",
     )
     log_file: Optional[str] = Field(None, validation_alias="LOG_FILE")
@@ -34,7 +87,7 @@ class LoggingSettings(BaseSettings):
         )
 
 class TransportSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True)
 
     mcp_transport: str = Field("stdio", validation_alias="MCP_TRANSPORT")
 
@@ -42,7 +95,7 @@ class TransportSettings(BaseSettings):
 class AppSettings(BaseSettings):
     """Manages application configuration using environment variables."""
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True)
 
     es_host: str = Field(..., validation_alias="ES_HOST")
     es_pipeline: str = Field("search-default-ingestion", validation_alias="ES_PIPELINE")
@@ -53,7 +106,6 @@ class AppSettings(BaseSettings):
 
     crawler_image: str = Field("ghcr.io/strawgate/es-crawler:main", validation_alias="CRAWLER_IMAGE")
 
-
     @model_validator(mode="after")
     def check_auth_logic(self) -> "AppSettings":
         """Validate that either API key or username/password is provided, but not both."""
@@ -70,6 +122,37 @@ class AppSettings(BaseSettings):
             )
         return self
 
+    @property
+    def es_index_pattern(self) -> str:
+        """The wildcard pattern matching every index managed under es_index_prefix."""
+        return f"{self.es_index_prefix}-*"
+
+    @property
+    def es_auth_args(self) -> Dict[str, Any]:
+        """The client authentication arguments for these credentials."""
+        return _build_auth_args(self.es_api_key, self.es_username, self.es_password)
+
+    @property
+    def es_host_scheme(self) -> str:
+        """The scheme of es_host, e.g. `https`."""
+        return _split_host(self.es_host).scheme
+
+    @property
+    def es_host_name(self) -> Optional[str]:
+        """The hostname of es_host without scheme or port."""
+        return _split_host(self.es_host).hostname
+
+    @property
+    def es_host_port(self) -> int:
+        """The port of es_host, defaulting to 443 for HTTPS and 80 otherwise."""
+        return _split_host(self.es_host).port
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Load AppSettings from the environment once per process."""
+    return AppSettings()
+
 
 # endregion Settings
 
@@ -169,32 +252,15 @@ def generate_index_template(index_pattern: list[str], pipeline_name: str) -> Dic
 def get_crawler_es_settings(settings: AppSettings):
     """Generates the Elasticsearch connection settings dictionary required by the crawler."""
     # for some reason the crawler takes ES settings in a weird format
-    parsed_url = urlparse(settings.es_host)
-
-    es_port = parsed_url.port
-
-    if es_port is None:
-        # Default to 443 for HTTPS
-        es_port = 443 if parsed_url.scheme == "https" else 80
-
-    es_host_without_port = parsed_url.hostname
-    es_host = parsed_url.scheme + "://" + es_host_without_port
+    es_host = settings.es_host_scheme + "://" + settings.es_host_name
 
     crawler_es_settings = {
         "host": es_host,  # e.g., https://cluster.aws.elastic.cloud
-        "port": es_port,  # e.g., 443
-        "request_timeout": 600,
-        "elasticsearch.bulk_api.max_items": 1000,
-        "elasticsearch.bulk_api.max_size_bytes": 10485760,
+        "port": settings.es_host_port,  # e.g., 443
+        **_CRAWLER_ES_BASE_SETTINGS,
         "pipeline": settings.es_pipeline,
+        **settings.es_auth_args,
     }
-    if settings.es_api_key:
-        crawler_es_settings["api_key"] = settings.es_api_key.get_secret_value()
-    elif settings.es_username and settings.es_password:
-        crawler_es_settings["basic_auth"] = (
-            settings.es_username,
-            settings.es_password.get_secret_value(),
-        )
 
     return crawler_es_settings
 
@@ -206,22 +272,11 @@ def create_es_client(settings: AppSettings):
     """
 
     es_client_args: Dict[str, Any] = {
+        **_ES_CLIENT_BASE_ARGS,
         "hosts": [settings.es_host],
-        "request_timeout": 180,
-        "http_compress": True,
-        "retry_on_status": (408, 429, 502, 503, 504),
-        "retry_on_timeout": True,
-        "max_retries": 5,
+        **settings.es_auth_args,
     }
 
-    if settings.es_api_key:
-        es_client_args["api_key"] = settings.es_api_key.get_secret_value()
-    elif settings.es_username and settings.es_password:
-        es_client_args["basic_auth"] = (
-            settings.es_username,
-            settings.es_password.get_secret_value(),
-        )
-
     client = AsyncElasticsearch(**es_client_args)
     return client
 
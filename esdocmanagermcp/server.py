@@ -11,13 +11,13 @@ from pydantic import ValidationError
 import mcp.server.fastmcp as fastmcp
 
 from esdocmanagermcp.components.shared import (
-    AppSettings,
     LoggingSettings,
     TransportSettings,
     create_es_client,
     generate_index_template,
     format_search_results_plain_text,
     get_crawler_es_settings,
+    get_settings,
 )
 from esdocmanagermcp.components.crawl import Crawler, CrawlerSettings
 from esdocmanagermcp.components.search import Searcher, SearcherSettings
@@ -48,7 +48,7 @@ except Exception as e:
 
 
 # region Lifespan
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     """Holds initialized components for the application."""
 
@@ -75,7 +75,7 @@ async def app_lifespan(server: fastmcp.FastMCP) -> AsyncIterator[AppContext]:
     logger.info("Executing application startup sequence...")
 
     try:
-        settings = AppSettings()
+        settings = get_settings()
         logger.info("Application settings loaded successfully.")
 
         # Initialize Component Settings from AppSettings
@@ -121,9 +121,9 @@ async def app_lifespan(server: fastmcp.FastMCP) -> AsyncIterator[AppContext]:
             **(
                 generate_index_template(
                     pipeline_name=settings.es_pipeline,
-                    index_pattern=settings.es_index_prefix + "-*",
+                    index_pattern=settings.es_index_pattern,
                 )
-            ),  # Assuming index pattern is set to settings.es_index_prefix)
+            ),
         )
 
         crawler = context.crawler